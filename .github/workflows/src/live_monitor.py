@@ -1,11 +1,64 @@
 # Live game monitoring for swap opportunities
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
 from datetime import datetime
+import hashlib
 import json
+import numpy as np
+import os
+import time
+import types
+
+# Bump whenever the shape of parse_espn_data's output changes
+SCHEMA_VERSION = 1
 
 class LiveMonitor:
+    _parse_cache_path = ".espn_parse_cache.json"
+    _parse_cache_limit = 50
+    
+    # Polling cadence (seconds) for live, daytime and overnight checks
+    LIVE_POLL_DELAY = 30
+    DAY_POLL_DELAY = 120
+    IDLE_POLL_DELAY = 600
+    DAY_HOURS = range(12, 24)
+    LIVE_STATUSES = frozenset({'STATUS_IN_PROGRESS', 'STATUS_HALFTIME'})
+    
+    # Swap recommendations attached to alerts as they are raised (read-only)
+    _BLOWOUT_SWAP = types.MappingProxyType({
+        'type': 'BLOWOUT_SWAP',
+        'action': 'Consider swapping players from losing team',
+        'urgency': 'HIGH'
+    })
+    _PACE_PIVOT = types.MappingProxyType({
+        'type': 'PACE_PIVOT',
+        'action': 'Pivot from game stack to individual plays',
+        'urgency': 'MEDIUM'
+    })
+    
     def __init__(self):
         self.alerts = []
+        self._recommendations = []
+        self.games = []
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Conditional GET state for the ESPN scoreboard
+        self._etag = None
+        self._last_modified = None
+        self._cached_games = []
+        
+        # Parsed scoreboards keyed by a hash of the raw response body
+        self._parse_cache = self.load_parse_cache()
+        
         self.your_lineup = {
             "Kelsey Plum": "LVA",
             "Sabrina Ionescu": "NYL", 
@@ -14,33 +67,106 @@ class LiveMonitor:
             "Napheesa Collier": "MIN",
             "Alyssa Thomas": "CONN"
         }
+        self._index_lineup()
+        
+    def set_lineup(self, lineup):
+        """Replace the monitored lineup (player name -> team code)"""
+        self.your_lineup = dict(lineup)
+        self._index_lineup()
+    
+    def _index_lineup(self):
+        """Precompute lookups derived from the monitored lineup"""
+        self._team_to_players = defaultdict(list)
+        for player, team in self.your_lineup.items():
+            self._team_to_players[self.map_team_name(team)].append(player)
+        
+        self._your_teams_set = frozenset(self._team_to_players)
         
+    def reset_alerts(self):
+        """Forget the alerts and swap recommendations from the previous check"""
+        self.alerts = []
+        self._recommendations = []
+    
     def check_games(self):
         """Main monitoring function"""
         print("🔄 Checking live games...")
+        self.reset_alerts()
         
         # Get live scores
         games = self.get_live_scores()
+        self.games = games
         
         if not games:
             print("⚠️ No live game data available")
             return []
         
-        # Analyze each game
-        for game in games:
-            self.analyze_game(game)
+        # Analyze all games at once
+        self.analyze_games(games)
         
         return self.alerts
     
+    async def acheck_games(self):
+        """Run check_games in a worker thread so other I/O can proceed"""
+        return await asyncio.to_thread(self.check_games)
+    
+    def next_poll_delay(self, games):
+        """Seconds to wait before the next poll based on game state"""
+        any_live = False
+        
+        for game in games:
+            if game['status'] not in self.LIVE_STATUSES:
+                continue
+            
+            any_live = True
+            score_diff = abs(game['home_score'] - game['away_score'])
+            if game['status'] == 'STATUS_IN_PROGRESS' and score_diff < 10:
+                return self.LIVE_POLL_DELAY
+        
+        # Live games never drop to the idle tier, whatever the runner's clock says
+        if any_live or (games and datetime.now().hour in self.DAY_HOURS):
+            return self.DAY_POLL_DELAY
+        
+        return self.IDLE_POLL_DELAY
+    
+    def watch(self, on_alerts=None):
+        """Poll games continuously, pacing requests to the game state"""
+        while True:
+            alerts = self.check_games()
+            
+            if alerts and on_alerts:
+                on_alerts(alerts)
+            
+            time.sleep(self.next_poll_delay(self.games))
+    
     def get_live_scores(self):
         """Fetch live WNBA scores"""
         try:
             url = "http://site.api.espn.com/apis/site/v2/sports/basketball/wnba/scoreboard"
-            response = requests.get(url, timeout=10)
             
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_espn_data(data)
+            # Only download the scoreboard if it changed since the last poll
+            headers = {}
+            if self._etag:
+                headers['If-None-Match'] = self._etag
+            if self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified
+            
+            response = self.session.get(url, headers=headers, timeout=10)
+            
+            if response.status_code == 304:
+                return self._cached_games
+            elif response.status_code == 200:
+                key = hashlib.blake2b(response.content).hexdigest()
+                games = self._parse_cache.get(key)
+                
+                if games is None:
+                    # The body is already in memory for the hash, so a plain parse is fastest
+                    games = self.parse_espn_data(json.loads(response.content))
+                    self.store_parsed_games(key, games)
+                
+                self._etag = response.headers.get('ETag')
+                self._last_modified = response.headers.get('Last-Modified')
+                self._cached_games = games
+                return games
             else:
                 print(f"❌ ESPN API error: {response.status_code}")
                 return []
@@ -49,6 +175,35 @@ class LiveMonitor:
             print(f"❌ Error fetching scores: {e}")
             return []
     
+    def load_parse_cache(self):
+        """Load parsed scoreboards from disk, discarding stale schemas"""
+        try:
+            with open(self._parse_cache_path) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('schema_version') != SCHEMA_VERSION:
+            return {}
+        
+        return cache.get('entries', {})
+    
+    def store_parsed_games(self, key, games):
+        """Remember parsed games in memory and persist them to disk"""
+        self._parse_cache[key] = games
+        
+        # Keep only the most recent scoreboards
+        while len(self._parse_cache) > self._parse_cache_limit:
+            del self._parse_cache[next(iter(self._parse_cache))]
+        
+        try:
+            tmp_path = self._parse_cache_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                json.dump({'schema_version': SCHEMA_VERSION, 'entries': self._parse_cache}, f)
+            os.replace(tmp_path, self._parse_cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not write parse cache: {e}")
+    
     def parse_espn_data(self, data):
         """Parse ESPN scoreboard data"""
         games = []
@@ -78,20 +233,31 @@ class LiveMonitor:
     
     def analyze_game(self, game):
         """Analyze game for swap opportunities"""
-        score_diff = abs(game['home_score'] - game['away_score'])
-        total_score = game['home_score'] + game['away_score']
+        self.analyze_games([game])
+    
+    def analyze_games(self, games):
+        """Analyze games for swap opportunities in one vectorized pass"""
+        home = np.array([g['home_score'] for g in games], dtype=np.int32)
+        away = np.array([g['away_score'] for g in games], dtype=np.int32)
+        period = np.array([g['period'] for g in games], dtype=np.int32)
         
-        # Check for blowouts
-        if score_diff >= 15 and game['period'] >= 3:
-            self.check_blowout_impact(game, score_diff)
+        score_diff = np.abs(home - away)
+        total_score = home + away
+        projected_total = np.where(period >= 2, total_score / np.maximum(period, 1) * 4, 0.0)
         
-        # Check pace/total
-        if game['period'] >= 2:
-            projected_total = (total_score / game['period']) * 4
-            self.check_pace_impact(game, projected_total)
+        # Blowouts, and paces outside the 160-180 band once a half is in
+        blowout_mask = (score_diff >= 15) & (period >= 3)
+        pace_mask = (period >= 2) & ((projected_total < 160) | (projected_total > 180))
         
-        # Check your players' teams
-        self.check_player_teams(game)
+        for i, game in enumerate(games):
+            if blowout_mask[i]:
+                self.check_blowout_impact(game, int(score_diff[i]))
+            
+            if pace_mask[i]:
+                self.check_pace_impact(game, float(projected_total[i]))
+            
+            # Check your players' teams
+            self.check_player_teams(game)
     
     def check_blowout_impact(self, game, score_diff):
         """Check if blowout affects your players"""
@@ -103,17 +269,14 @@ class LiveMonitor:
             winning_team = game['away_team']
         
         # Check if your players are affected
-        affected_players = []
-        for player, team in self.your_lineup.items():
-            team_abbrev = self.map_team_name(team)
-            if team_abbrev == losing_team:
-                affected_players.append(player)
+        affected_players = self._team_to_players.get(losing_team, [])
         
         if affected_players:
             alert = f"🚨 BLOWOUT ALERT: {game['away_team']} @ {game['home_team']} "
             alert += f"({game['away_score']}-{game['home_score']}) "
             alert += f"Your players at risk: {', '.join(affected_players)}"
             self.alerts.append(alert)
+            self._recommendations.append(self._BLOWOUT_SWAP)
     
     def check_pace_impact(self, game, projected_total):
         """Check game pace impact"""
@@ -121,6 +284,7 @@ class LiveMonitor:
             alert = f"⚠️ LOW TOTAL: {game['away_team']} @ {game['home_team']} "
             alert += f"projecting {projected_total:.0f} total - Consider pivoting"
             self.alerts.append(alert)
+            self._recommendations.append(self._PACE_PIVOT)
         
         elif projected_total > 180:
             alert = f"🔥 HIGH TOTAL: {game['away_team']} @ {game['home_team']} "
@@ -129,10 +293,7 @@ class LiveMonitor:
     
     def check_player_teams(self, game):
         """Check if game involves your players' teams"""
-        your_teams = set(self.map_team_name(team) for team in self.your_lineup.values())
-        game_teams = {game['home_team'], game['away_team']}
-        
-        if your_teams.intersection(game_teams):
+        if self._your_teams_set & {game['home_team'], game['away_team']}:
             print(f"📊 Monitoring: {game['away_team']} @ {game['home_team']} (your players involved)")
     
     def map_team_name(self, team_code):
@@ -149,20 +310,5 @@ class LiveMonitor:
     
     def get_swap_recommendations(self):
         """Generate specific swap recommendations"""
-        recommendations = []
-        
-        for alert in self.alerts:
-            if "BLOWOUT" in alert:
-                recommendations.append({
-                    'type': 'BLOWOUT_SWAP',
-                    'action': 'Consider swapping players from losing team',
-                    'urgency': 'HIGH'
-                })
-            elif "LOW TOTAL" in alert:
-                recommendations.append({
-                    'type': 'PACE_PIVOT', 
-                    'action': 'Pivot from game stack to individual plays',
-                    'urgency': 'MEDIUM'
-                })
-        
-        return recommendations
+        # Recommendations are recorded as alerts are raised
+        return [dict(rec) for rec in self._recommendations]
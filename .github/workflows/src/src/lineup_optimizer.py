@@ -2,11 +2,49 @@
 import json
 from itertools import combinations
 import random
+import types
+import numpy as np
+import pulp
 
 class LineupOptimizer:
+    _lineup_cache_size = 128
+    
+    # Static game stacking recommendations for the current slate (read-only)
+    _STACK_RECOMMENDATIONS = tuple(types.MappingProxyType(rec) for rec in (
+        {
+            'game': 'LVA vs CONN',
+            'reason': 'Highest projected total (175+)',
+            'players': ('A\'ja Wilson', 'Kelsey Plum', 'Alyssa Thomas'),
+            'priority': 'HIGH'
+        },
+        {
+            'game': 'NYL vs MIN', 
+            'reason': 'Championship rematch, high pace',
+            'players': ('Breanna Stewart', 'Sabrina Ionescu', 'Napheesa Collier'),
+            'priority': 'MEDIUM'
+        },
+        {
+            'game': 'DAL vs WSH',
+            'reason': 'Paige Bueckers debut value',
+            'players': ('Paige Bueckers',),
+            'priority': 'MEDIUM'
+        }
+    ))
+    
     def __init__(self):
         self.salary_cap = 50000
+        self._lineup_cache = {}
         self.player_pool = self.load_player_pool()
+        self.build_player_arrays()
+        
+        # Strategy name -> builder, resolved once instead of per call
+        self._builders = {
+            "Ceiling": self.build_ceiling_lineup,
+            "Balanced": self.build_balanced_lineup,
+            "Contrarian": self.build_contrarian_lineup,
+            "Game Stack": self.build_game_stack_lineup,
+            "Value": self.build_value_lineup
+        }
         
     def load_player_pool(self):
         """Load current WNBA player pool with projections"""
@@ -27,6 +65,63 @@ class LineupOptimizer:
             ]
         }
     
+    def build_player_arrays(self, players=None):
+        """Precompute per-player columns (struct of arrays) and sort orders"""
+        if players is None:
+            players = self.player_pool["guards"]
+        
+        self._pool_key = self.pool_state_key(players)
+        self.salaries = np.array([p['salary'] for p in players], dtype=np.int32)
+        self.projections = np.array([p['projection'] for p in players], dtype=np.float64)
+        self.ownership = np.array([p['ownership'] for p in players], dtype=np.float64)
+        self.value = self.projections / (self.salaries / 1000)
+        
+        for player, value in zip(players, self.value):
+            player['value'] = float(value)
+        
+        self._pool_orders = {
+            'projection': sorted(players, key=lambda x: x['projection'], reverse=True),
+            'value': sorted(players, key=lambda x: x['projection']/x['salary']*1000, reverse=True),
+            'ownership': sorted(players, key=lambda x: x['ownership'])
+        }
+    
+    def _sync_player_arrays(self, players):
+        """Rebuild the columns and sort orders if any player field changed since the last build"""
+        if self.pool_state_key(players) != self._pool_key:
+            self.build_player_arrays(players)
+    
+    def _player_arrays(self, players):
+        """Return salary, projection, ownership and value columns for players"""
+        self._sync_player_arrays(players)
+        return self.salaries, self.projections, self.ownership, self.value
+    
+    def _player_orders(self, players):
+        """Return players sorted by projection (desc), value (desc) and ownership (asc)"""
+        self._sync_player_arrays(players)
+        return self._pool_orders
+    
+    def solve_lineup_ilp(self, players, objective):
+        """Pick the 6 players maximizing objective under cap and position rules"""
+        salaries, _, _, _ = self._player_arrays(players)
+        
+        prob = pulp.LpProblem("dfs_lineup", pulp.LpMaximize)
+        x = [pulp.LpVariable(f"x{i}", cat=pulp.LpBinary) for i in range(len(players))]
+        
+        prob += pulp.lpSum(float(objective[i]) * x[i] for i in range(len(players)))
+        prob += pulp.lpSum(int(salaries[i]) * x[i] for i in range(len(players))) <= self.salary_cap
+        prob += pulp.lpSum(x) == 6
+        
+        # WNBA DK format: need at least 2G, 3F, 1 UTIL
+        prob += pulp.lpSum(x[i] for i, p in enumerate(players) if p['position'] == 'G') >= 2
+        prob += pulp.lpSum(x[i] for i, p in enumerate(players) if p['position'] == 'F') >= 3
+        
+        prob.solve(pulp.PULP_CBC_CMD(msg=0))
+        
+        if pulp.LpStatus[prob.status] != 'Optimal':
+            return []
+        
+        return [p for p, var in zip(players, x) if var.value() > 0.5]
+    
     def generate_lineups(self, count=5):
         """Generate multiple optimized lineups"""
         print(f"🎯 Generating {count} optimal lineups...")
@@ -48,59 +143,63 @@ class LineupOptimizer:
         
         return lineups
     
+    def pool_state_key(self, players):
+        """Key identifying the player fields the lineup builders read"""
+        return tuple((p['name'], p['position'], p['salary'], p['projection'], p['ownership'], p['team'])
+                     for p in players)
+    
+    def build_state_key(self, strategy, players):
+        """Key identifying a strategy build over a given player pool"""
+        return (strategy, self.salary_cap, self.pool_state_key(players))
+    
     def build_lineup_by_strategy(self, strategy):
-        """Build lineup based on specific strategy"""
+        """Build lineup based on specific strategy, reusing cached builds"""
         players = self.player_pool["guards"]  # All players in one pool for simplicity
+        key = self.build_state_key(strategy, players)
         
-        if strategy == "Ceiling":
-            return self.build_ceiling_lineup(players)
-        elif strategy == "Balanced":
-            return self.build_balanced_lineup(players)
-        elif strategy == "Contrarian":
-            return self.build_contrarian_lineup(players)
-        elif strategy == "Game Stack":
-            return self.build_game_stack_lineup(players)
-        elif strategy == "Value":
-            return self.build_value_lineup(players)
-        else:
-            return self.build_balanced_lineup(players)
+        if key not in self._lineup_cache:
+            if len(self._lineup_cache) >= self._lineup_cache_size:
+                del self._lineup_cache[next(iter(self._lineup_cache))]
+            self._lineup_cache[key] = self._build_lineup_uncached(strategy, players)
+        
+        # Callers annotate the lineup and swap players, so hand out a copy of the cached one
+        lineup = self._lineup_cache[key]
+        return {**lineup, 'players': list(lineup['players'])} if lineup else lineup
+    
+    def _build_lineup_uncached(self, strategy, players):
+        """Dispatch to the builder for a strategy"""
+        builder = self._builders.get(strategy, self.build_balanced_lineup)
+        return builder(players)
     
     def build_ceiling_lineup(self, players):
         """Build highest ceiling lineup"""
-        # Sort by projection, take top players within salary
-        sorted_players = sorted(players, key=lambda x: x['projection'], reverse=True)
-        
-        selected = []
-        total_salary = 0
-        
-        for player in sorted_players:
-            if len(selected) < 6 and total_salary + player['salary'] <= self.salary_cap:
-                selected.append(player)
-                total_salary += player['salary']
+        # Maximize total projection
+        _, projections, _, _ = self._player_arrays(players)
+        selected = self.solve_lineup_ilp(players, projections)
         
         return self.create_lineup_object(selected)
     
     def build_balanced_lineup(self, players):
         """Build balanced risk/reward lineup"""
         # Target: 1-2 high salary, 2-3 mid salary, 1-2 value plays
+        orders = self._player_orders(players)
         
-        high_salary = [p for p in players if p['salary'] >= 9000]
-        mid_salary = [p for p in players if 6000 <= p['salary'] < 9000]
-        value_plays = [p for p in players if p['salary'] < 6000]
+        # Filtering a presorted list keeps it sorted
+        high_salary = [p for p in orders['projection'] if p['salary'] >= 9000]
+        mid_sorted = [p for p in orders['value'] if 6000 <= p['salary'] < 9000]
+        value_sorted = [p for p in orders['projection'] if p['salary'] < 6000]
         
         selected = []
         
         # Add 1 high salary player
         if high_salary:
-            selected.append(max(high_salary, key=lambda x: x['projection']))
+            selected.append(high_salary[0])
         
         # Add 3 mid salary players
-        mid_sorted = sorted(mid_salary, key=lambda x: x['projection']/x['salary']*1000, reverse=True)
         selected.extend(mid_sorted[:3])
         
         # Fill with value plays
         remaining_salary = self.salary_cap - sum(p['salary'] for p in selected)
-        value_sorted = sorted(value_plays, key=lambda x: x['projection'], reverse=True)
         
         for player in value_sorted:
             if len(selected) < 6 and player['salary'] <= remaining_salary:
@@ -112,7 +211,7 @@ class LineupOptimizer:
     def build_contrarian_lineup(self, players):
         """Build low-ownership contrarian lineup"""
         # Sort by low ownership, but maintain reasonable projections
-        contrarian_players = sorted(players, key=lambda x: x['ownership'])
+        contrarian_players = self._player_orders(players)['ownership']
         
         selected = []
         total_salary = 0
@@ -129,24 +228,24 @@ class LineupOptimizer:
     def build_game_stack_lineup(self, players):
         """Build lineup stacking specific games"""
         # Focus on Aces vs Sun game (highest projected total)
-        lva_conn_players = [p for p in players if p['team'] in ['LVA', 'CONN']]
-        nyl_min_players = [p for p in players if p['team'] in ['NYL', 'MIN']]
+        by_projection = self._player_orders(players)['projection']
+        lva_conn_sorted = [p for p in by_projection if p['team'] in ['LVA', 'CONN']]
+        nyl_min_sorted = [p for p in by_projection if p['team'] in ['NYL', 'MIN']]
         
         selected = []
         
         # Take 3 from LVA/CONN game
-        lva_conn_sorted = sorted(lva_conn_players, key=lambda x: x['projection'], reverse=True)
         selected.extend(lva_conn_sorted[:3])
         
         # Take 2 from NYL/MIN game  
-        nyl_min_sorted = sorted(nyl_min_players, key=lambda x: x['projection'], reverse=True)
         selected.extend(nyl_min_sorted[:2])
         
         # Fill last spot with best remaining value
         remaining_salary = self.salary_cap - sum(p['salary'] for p in selected)
-        remaining_players = [p for p in players if p not in selected]
+        selected_ids = {id(p) for p in selected}
+        remaining_players = [p for p in by_projection if id(p) not in selected_ids]
         
-        for player in sorted(remaining_players, key=lambda x: x['projection'], reverse=True):
+        for player in remaining_players:
             if player['salary'] <= remaining_salary:
                 selected.append(player)
                 break
@@ -155,19 +254,9 @@ class LineupOptimizer:
     
     def build_value_lineup(self, players):
         """Build best points-per-dollar lineup"""
-        # Calculate value score (projection per $1000 salary)
-        for player in players:
-            player['value'] = player['projection'] / (player['salary'] / 1000)
-        
-        value_sorted = sorted(players, key=lambda x: x['value'], reverse=True)
-        
-        selected = []
-        total_salary = 0
-        
-        for player in value_sorted:
-            if len(selected) < 6 and total_salary + player['salary'] <= self.salary_cap:
-                selected.append(player)
-                total_salary += player['salary']
+        # Maximize total value score (projection per $1000 salary)
+        _, _, _, value = self._player_arrays(players)
+        selected = self.solve_lineup_ilp(players, value)
         
         return self.create_lineup_object(selected)
     
@@ -228,7 +317,8 @@ class LineupOptimizer:
             row.extend([f['name'] for f in forwards[:3]])  # F, F, F
             
             # UTIL (remaining player)
-            remaining = [p for p in players if p not in guards[:2] and p not in forwards[:3]]
+            used = {id(p) for p in guards[:2]} | {id(p) for p in forwards[:3]}
+            remaining = [p for p in players if id(p) not in used]
             if remaining:
                 row.append(remaining[0]['name'])
             else:
@@ -240,28 +330,7 @@ class LineupOptimizer:
     
     def get_stack_recommendations(self):
         """Get game stacking recommendations"""
-        recommendations = [
-            {
-                'game': 'LVA vs CONN',
-                'reason': 'Highest projected total (175+)',
-                'players': ['A\'ja Wilson', 'Kelsey Plum', 'Alyssa Thomas'],
-                'priority': 'HIGH'
-            },
-            {
-                'game': 'NYL vs MIN', 
-                'reason': 'Championship rematch, high pace',
-                'players': ['Breanna Stewart', 'Sabrina Ionescu', 'Napheesa Collier'],
-                'priority': 'MEDIUM'
-            },
-            {
-                'game': 'DAL vs WSH',
-                'reason': 'Paige Bueckers debut value',
-                'players': ['Paige Bueckers'],
-                'priority': 'MEDIUM'
-            }
-        ]
-        
-        return recommendations
+        return [dict(rec, players=list(rec['players'])) for rec in self._STACK_RECOMMENDATIONS]
     
     def optimize_for_contest_type(self, contest_type, lineup_count=1):
         """Optimize lineups for specific contest types"""
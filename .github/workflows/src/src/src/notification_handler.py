@@ -1,14 +1,47 @@
 # Notification system for DFS alerts and updates
+import asyncio
 import os
+import re
+import time
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 import json
 
 class NotificationHandler:
+    _HIGH_RE = re.compile(r'blowout|foul trouble|injury', re.I)
+    _MED_RE = re.compile(r'low total|high total|pace', re.I)
+    _BOLD_ITALIC_RE = re.compile(r'\*\*\*(.+?)\*\*\*')
+    _BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+    _ITALIC_RE = re.compile(r'(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)')
+    # Spans a message split must keep whole: HTML elements and tags, then the markers above
+    _MARKUP_RE = re.compile(
+        r'<([a-zA-Z]+)[^<>]*>.*?</\1>|<[^<>]*>?'
+        r'|\*\*\*.+?\*\*\*|\*\*.+?\*\*|(?<!\*)\*(?!\*).+?(?<!\*)\*(?!\*)'
+    )
+    
+    TELEGRAM_MAX_LENGTH = 4096
+    BATCH_SEPARATOR = "\n\n" + "-" * 30 + "\n\n"
+    
     def __init__(self):
         self.telegram_token = os.environ.get('TELEGRAM_TOKEN')
         self.telegram_chat_id = os.environ.get('TELEGRAM_CHAT_ID')
         self.notification_methods = []
+        self._aio_session = None
+        self._ts_cache = (None, None)
+        self._pending = []  # Telegram messages waiting for flush()
+        
+        # Reuse connections to the Telegram API between messages
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Determine available notification methods
         if self.telegram_token and self.telegram_chat_id:
@@ -20,6 +53,10 @@ class NotificationHandler:
     
     def send_alerts(self, alerts):
         """Send alerts through all configured methods"""
+        self._run(self.send_alerts_async(alerts))
+    
+    async def send_alerts_async(self, alerts):
+        """Send alerts through all configured methods concurrently"""
         if not alerts:
             print("✅ No alerts to send")
             return
@@ -27,47 +64,146 @@ class NotificationHandler:
         # Format the alert message
         message = self.format_alert_message(alerts)
         
-        # Send through each method
-        for method in self.notification_methods:
+        await self._broadcast(message)
+    
+    def _run(self, coro):
+        """Run a coroutine to completion, closing the HTTP session afterwards"""
+        async def runner():
             try:
-                if method == 'telegram':
-                    self.send_telegram_message(message)
-                elif method == 'console':
-                    self.print_to_console(message)
-            except Exception as e:
-                print(f"❌ Failed to send via {method}: {e}")
+                return await coro
+            finally:
+                await self.aclose()
+        
+        return asyncio.run(runner())
+    
+    async def _broadcast(self, message, what=''):
+        """Send a message through every notification method concurrently"""
+        tasks = [
+            asyncio.create_task(self._send(method, message))
+            for method in self.notification_methods
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        for method, result in zip(self.notification_methods, results):
+            if isinstance(result, Exception):
+                target = f"{what} " if what else ""
+                print(f"❌ Failed to send {target}via {method}: {result}")
+    
+    async def _send(self, method, message):
+        """Deliver a message through a single notification method"""
+        if method == 'telegram':
+            await self.send_telegram_message_async(message)
+        elif method == 'console':
+            self.print_to_console(message)
+    
+    def queue(self, message):
+        """Hold a Telegram message until the next flush()"""
+        if 'telegram' in self.notification_methods:
+            self._pending.append(message)
+    
+    def flush(self):
+        """Send queued messages as few Telegram messages as the length limit allows"""
+        return self._run(self.flush_async())
+    
+    async def flush_async(self):
+        """Send queued messages as few Telegram messages as the length limit allows"""
+        if not self._pending:
+            return 0
+        
+        pending, self._pending = self._pending, []
+        batches = []
+        current = ''
+        
+        for message in pending:
+            for piece in self._split_message(message):
+                candidate = f"{current}{self.BATCH_SEPARATOR}{piece}" if current else piece
+                
+                if current and len(candidate) > self.TELEGRAM_MAX_LENGTH:
+                    batches.append(current)
+                    current = piece
+                else:
+                    current = candidate
+        
+        if current:
+            batches.append(current)
+        
+        for batch in batches:
+            await self.send_telegram_message_async(batch)
+        
+        return len(batches)
+    
+    def _split_message(self, message):
+        """Cut a message into pieces Telegram accepts, breaking at newlines where possible"""
+        pieces = []
+        
+        while len(message) > self.TELEGRAM_MAX_LENGTH:
+            cut = message.rfind("\n", 0, self.TELEGRAM_MAX_LENGTH + 1)
+            if cut <= 0:
+                cut = self._hard_cut(message)
+            
+            pieces.append(message[:cut])
+            message = message[cut:].lstrip("\n")
+        
+        if message:
+            pieces.append(message)
+        
+        return pieces
+    
+    def _hard_cut(self, line):
+        """Cut point for an overlong line that does not split a formatted span or HTML tag"""
+        for span in self._MARKUP_RE.finditer(line):
+            if span.start() >= self.TELEGRAM_MAX_LENGTH:
+                break
+            if span.end() > self.TELEGRAM_MAX_LENGTH:
+                # Move the cut before the span unless it opens the line
+                return span.start() or self.TELEGRAM_MAX_LENGTH
+        
+        return self.TELEGRAM_MAX_LENGTH
+    
+    def _now_formatted(self):
+        """Return (time_str, date_str) for now, recomputed at most once a second"""
+        bucket = int(time.monotonic())
+        
+        if self._ts_cache[0] != bucket:
+            now = datetime.now()
+            self._ts_cache = (bucket, (now.strftime('%I:%M %p ET'), now.strftime('%B %d, %Y')))
+        
+        return self._ts_cache[1]
     
     def format_alert_message(self, alerts):
         """Format alerts into a readable message"""
-        timestamp = datetime.now().strftime('%I:%M %p ET')
+        timestamp, date_str = self._now_formatted()
         
         # Create header
-        message = f"🚨 DFS ALERT SYSTEM\n"
-        message += f"📅 {datetime.now().strftime('%B %d, %Y')}\n"
-        message += f"🕐 {timestamp}\n"
-        message += "=" * 30 + "\n\n"
+        parts = [
+            "🚨 DFS ALERT SYSTEM",
+            f"📅 {date_str}",
+            f"🕐 {timestamp}",
+            "=" * 30,
+            ""
+        ]
         
         # Add alerts
         for i, alert in enumerate(alerts, 1):
             priority = self.get_alert_priority(alert)
             emoji = self.get_priority_emoji(priority)
             
-            message += f"{emoji} ALERT #{i}\n"
-            message += f"   {alert}\n\n"
+            parts.append(f"{emoji} ALERT #{i}")
+            parts.append(f"   {alert}")
+            parts.append("")
         
         # Add footer
-        message += f"📊 Total alerts: {len(alerts)}\n"
-        message += "💡 Check lineup for potential swaps\n"
+        parts.append(f"📊 Total alerts: {len(alerts)}")
+        parts.append("💡 Check lineup for potential swaps")
+        parts.append("")
         
-        return message
+        return "\n".join(parts)
     
     def get_alert_priority(self, alert):
         """Determine alert priority based on content"""
-        alert_lower = alert.lower()
-        
-        if any(keyword in alert_lower for keyword in ['blowout', 'foul trouble', 'injury']):
+        if self._HIGH_RE.search(alert):
             return 'HIGH'
-        elif any(keyword in alert_lower for keyword in ['low total', 'high total', 'pace']):
+        elif self._MED_RE.search(alert):
             return 'MEDIUM'
         else:
             return 'LOW'
@@ -81,37 +217,69 @@ class NotificationHandler:
         }
         return emoji_map.get(priority, '📢')
     
+    def _telegram_request(self, message):
+        """Build the sendMessage URL and payload shared by both Telegram senders"""
+        url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
+        
+        payload = {
+            'chat_id': self.telegram_chat_id,
+            'text': self.format_for_telegram(message),
+            'parse_mode': 'HTML',
+            'disable_web_page_preview': 'true'
+        }
+        
+        return url, payload
+    
+    def _report_telegram_status(self, status, body):
+        """Log the outcome of a sendMessage call"""
+        if status == 200:
+            print("✅ Telegram alert sent successfully")
+        else:
+            print(f"❌ Telegram API error: {status}")
+            print(f"Response: {body}")
+    
     def send_telegram_message(self, message):
         """Send message via Telegram bot"""
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_token}/sendMessage"
-            
-            # Format message for Telegram
-            telegram_message = self.format_for_telegram(message)
+            url, payload = self._telegram_request(message)
+            response = self.session.post(url, data=payload, timeout=10)
+            self._report_telegram_status(response.status_code, response.text)
             
-            payload = {
-                'chat_id': self.telegram_chat_id,
-                'text': telegram_message,
-                'parse_mode': 'HTML',
-                'disable_web_page_preview': True
-            }
-            
-            response = requests.post(url, data=payload, timeout=10)
+        except Exception as e:
+            print(f"❌ Telegram error: {e}")
+    
+    async def send_telegram_message_async(self, message):
+        """Send message via Telegram bot without blocking the event loop"""
+        try:
+            url, payload = self._telegram_request(message)
             
-            if response.status_code == 200:
-                print("✅ Telegram alert sent successfully")
-            else:
-                print(f"❌ Telegram API error: {response.status_code}")
-                print(f"Response: {response.text}")
+            async with self._get_aio_session().post(url, data=payload) as response:
+                body = await response.text() if response.status != 200 else ''
+                self._report_telegram_status(response.status, body)
                 
         except Exception as e:
             print(f"❌ Telegram error: {e}")
     
+    def _get_aio_session(self):
+        """Return the shared aiohttp session, creating it on first use"""
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._aio_session
+    
+    async def aclose(self):
+        """Close the shared aiohttp session"""
+        if self._aio_session is not None:
+            await self._aio_session.close()
+            self._aio_session = None
+    
     def format_for_telegram(self, message):
         """Format message for Telegram HTML parsing"""
-        # Replace markdown-style formatting with HTML
-        formatted = message.replace('**', '<b>').replace('**', '</b>')
-        formatted = formatted.replace('*', '<i>').replace('*', '</i>')
+        # Replace markdown-style formatting with HTML, pairing open/close markers
+        formatted = self._BOLD_ITALIC_RE.sub(r'<b><i>\1</i></b>', message)
+        formatted = self._BOLD_RE.sub(r'<b>\1</b>', formatted)
+        formatted = self._ITALIC_RE.sub(r'<i>\1</i>', formatted)
         
         return formatted
     
@@ -129,58 +297,50 @@ class NotificationHandler:
         message = self.format_lineup_summary(lineups)
         
         # Send summary
-        for method in self.notification_methods:
-            try:
-                if method == 'telegram':
-                    self.send_telegram_message(message)
-                elif method == 'console':
-                    self.print_to_console(message)
-            except Exception as e:
-                print(f"❌ Failed to send lineup summary via {method}: {e}")
+        self._run(self._broadcast(message, "lineup summary"))
     
     def format_lineup_summary(self, lineups):
         """Format lineup summary message"""
-        timestamp = datetime.now().strftime('%I:%M %p ET')
+        timestamp, _ = self._now_formatted()
         
-        message = f"📋 LINEUP SUMMARY\n"
-        message += f"🕐 Generated at {timestamp}\n"
-        message += "=" * 25 + "\n\n"
+        parts = [
+            "📋 LINEUP SUMMARY",
+            f"🕐 Generated at {timestamp}",
+            "=" * 25,
+            ""
+        ]
         
         for lineup in lineups:
-            message += f"🎯 {lineup['strategy']} Strategy\n"
-            message += f"   💰 Salary: ${lineup['salary']:,}/50,000\n"
-            message += f"   📊 Projection: {lineup['projection']:.1f} points\n"
-            message += f"   👥 Avg Ownership: {lineup['ownership']:.1f}%\n"
+            parts.append(f"🎯 {lineup['strategy']} Strategy")
+            parts.append(f"   💰 Salary: ${lineup['salary']:,}/50,000")
+            parts.append(f"   📊 Projection: {lineup['projection']:.1f} points")
+            parts.append(f"   👥 Avg Ownership: {lineup['ownership']:.1f}%")
             
             # Top 3 players
             top_players = sorted(lineup['players'], key=lambda x: x['salary'], reverse=True)[:3]
-            message += f"   🌟 Key Players: {', '.join(p['name'] for p in top_players)}\n\n"
+            parts.append(f"   🌟 Key Players: {', '.join(p['name'] for p in top_players)}")
+            parts.append("")
         
-        message += f"📈 Ready for contest entry!\n"
-        message += f"🎯 Target contests: GPP + Double Up\n"
+        parts.append("📈 Ready for contest entry!")
+        parts.append("🎯 Target contests: GPP + Double Up")
+        parts.append("")
         
-        return message
+        return "\n".join(parts)
     
     def send_swap_recommendation(self, player_out, player_in, reason):
         """Send specific swap recommendation"""
         message = f"🔄 SWAP RECOMMENDATION\n"
-        message += f"🕐 {datetime.now().strftime('%I:%M %p ET')}\n\n"
+        message += f"🕐 {self._now_formatted()[0]}\n\n"
         message += f"❌ SWAP OUT: {player_out}\n"
         message += f"✅ SWAP IN: {player_in}\n"
         message += f"💡 REASON: {reason}\n\n"
         message += f"⏰ Execute swap before game locks!"
         
-        # Send with high priority formatting
-        for method in self.notification_methods:
-            try:
-                if method == 'telegram':
-                    # Add urgent formatting for Telegram
-                    urgent_message = f"🚨 <b>URGENT SWAP ALERT</b> 🚨\n\n{message}"
-                    self.send_telegram_message(urgent_message)
-                elif method == 'console':
-                    print(f"\n🚨 URGENT: {message}")
-            except Exception as e:
-                print(f"❌ Failed to send swap alert via {method}: {e}")
+        # Send with high priority formatting; Telegram goes out on the next flush()
+        self.queue(f"🚨 <b>URGENT SWAP ALERT</b> 🚨\n\n{message}")
+        
+        if 'console' in self.notification_methods:
+            print(f"\n🚨 URGENT: {message}")
     
     def send_game_update(self, game_info):
         """Send live game update"""
@@ -198,19 +358,16 @@ class NotificationHandler:
         if score_diff >= 15:
             message += f"\n🚨 BLOWOUT ALERT: {score_diff} point lead!"
             
-            for method in self.notification_methods:
-                try:
-                    if method == 'telegram':
-                        self.send_telegram_message(message)
-                    elif method == 'console':
-                        print(f"\n{message}")
-                except Exception as e:
-                    print(f"❌ Failed to send game update via {method}: {e}")
+            # Telegram goes out on the next flush()
+            self.queue(message)
+            
+            if 'console' in self.notification_methods:
+                print(f"\n{message}")
     
     def test_notifications(self):
         """Test all notification methods"""
         test_message = f"🧪 DFS Bot Test Message\n"
-        test_message += f"🕐 {datetime.now().strftime('%I:%M %p ET')}\n"
+        test_message += f"🕐 {self._now_formatted()[0]}\n"
         test_message += f"✅ Notification system working!\n"
         test_message += f"📱 Methods: {', '.join(self.notification_methods)}"
         
@@ -230,14 +387,18 @@ class NotificationHandler:
     
     def send_daily_summary(self, total_alerts, lineup_count, monitor_duration):
         """Send end-of-day summary"""
-        message = f"📈 DAILY DFS SUMMARY\n"
-        message += f"📅 {datetime.now().strftime('%B %d, %Y')}\n"
-        message += "=" * 25 + "\n\n"
-        message += f"🚨 Total Alerts: {total_alerts}\n"
-        message += f"📋 Lineups Generated: {lineup_count}\n"
-        message += f"⏰ Monitor Duration: {monitor_duration}\n\n"
-        message += f"🎯 Bot performance: {'🟢 Active' if total_alerts > 0 else '🟡 Quiet day'}\n"
-        message += f"💡 Ready for tomorrow's slate!"
+        message = "\n".join([
+            "📈 DAILY DFS SUMMARY",
+            f"📅 {self._now_formatted()[1]}",
+            "=" * 25,
+            "",
+            f"🚨 Total Alerts: {total_alerts}",
+            f"📋 Lineups Generated: {lineup_count}",
+            f"⏰ Monitor Duration: {monitor_duration}",
+            "",
+            f"🎯 Bot performance: {'🟢 Active' if total_alerts > 0 else '🟡 Quiet day'}",
+            "💡 Ready for tomorrow's slate!"
+        ])
         
         for method in self.notification_methods:
             try:
@@ -0,0 +1,65 @@
+# ESPN scoreboard event parsing
+#
+# Kept free of class state and fully annotated so it can be compiled
+# ahead of time with mypyc (`mypyc _parse.py`). The plain Python module
+# is used whenever no compiled extension is present.
+from typing import Any, Dict, FrozenSet
+
+from game import Game
+
+# ESPN status names for games with live scores
+LIVE_STATUSES: FrozenSet[str] = frozenset({'STATUS_IN_PROGRESS', 'STATUS_HALFTIME'})
+
+
+def _parse_event(event: Dict[str, Any]) -> Game:
+    """Parse a single ESPN scoreboard event"""
+    competition: Dict[str, Any] = event['competitions'][0]
+    competitors = competition['competitors']
+
+    # Extract team info
+    home_team: Dict[str, Any] = competitors[0]
+    away_team: Dict[str, Any] = competitors[1]
+    status: Dict[str, Any] = event['status']
+    status_name: str = status['type']['name']
+
+    game_info: Dict[str, Any] = {
+        'id': event['id'],
+        'home_team': home_team['team']['displayName'],
+        'away_team': away_team['team']['displayName'],
+        'home_abbrev': home_team['team']['abbreviation'],
+        'away_abbrev': away_team['team']['abbreviation'],
+        'start_time': event['date'],
+        'status': status_name,
+        'venue': competition.get('venue', {}).get('fullName', 'Unknown'),
+        'tv_broadcast': extract_broadcast_info(competition),
+        'odds': extract_odds(competition)
+    }
+
+    # Add live scores if game is in progress
+    if status_name in LIVE_STATUSES:
+        game_info['home_score'] = int(home_team.get('score', 0))
+        game_info['away_score'] = int(away_team.get('score', 0))
+        game_info['period'] = status.get('period', 1)
+        game_info['clock'] = status.get('displayClock', '')
+        game_info['is_live'] = True
+    else:
+        game_info['is_live'] = False
+
+    return Game(**game_info)
+
+
+def extract_broadcast_info(competition: Dict[str, Any]) -> str:
+    """Extract TV broadcast information"""
+    broadcasts = competition.get('broadcasts') or []
+    if broadcasts:
+        return (broadcasts[0].get('names') or ['Unknown'])[0]
+    return 'Not Available'
+
+
+def extract_odds(competition: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract betting odds if available"""
+    odds: Dict[str, Any] = (competition.get('odds') or [{}])[0]
+    return {
+        'spread': odds.get('details', 'N/A'),
+        'total': odds.get('overUnder', 'N/A')
+    }
@@ -0,0 +1,41 @@
+# Game record shared by the data collection modules
+
+class Game:
+    """A scheduled or live WNBA game
+
+    Uses __slots__ rather than a per-instance dict to keep game records
+    small. Slots are declared by hand because the bot still runs on
+    Python 3.9, where dataclass(slots=True) is unavailable.
+    """
+    __slots__ = (
+        'id', 'home_team', 'away_team', 'home_abbrev', 'away_abbrev',
+        'start_time', 'status', 'venue', 'tv_broadcast', 'is_live',
+        'home_score', 'away_score', 'period', 'clock', 'projected_total', 'odds'
+    )
+
+    def __init__(self, id, home_team, away_team, home_abbrev, away_abbrev, start_time, status,
+                 venue='Unknown', tv_broadcast='Not Available', is_live=False, home_score=0,
+                 away_score=0, period=0, clock='', projected_total=165.0, odds=None):
+        self.id = id
+        self.home_team = home_team
+        self.away_team = away_team
+        self.home_abbrev = home_abbrev
+        self.away_abbrev = away_abbrev
+        self.start_time = start_time
+        self.status = status
+        self.venue = venue
+        self.tv_broadcast = tv_broadcast
+        self.is_live = is_live
+        self.home_score = home_score
+        self.away_score = away_score
+        self.period = period
+        self.clock = clock
+        self.projected_total = projected_total
+        self.odds = odds
+
+    def asdict(self):
+        """Return the game as a plain dict (for JSON export)"""
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    def __repr__(self):
+        return f"Game({self.asdict()!r})"
@@ -1,4 +1,5 @@
 # DFS Bot Main Entry Point
+import asyncio
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -20,34 +21,43 @@ class DFSBot:
         
     def run(self):
         """Main bot execution"""
+        asyncio.run(self.arun())
+    
+    async def arun(self):
+        """Main bot execution, overlapping the independent stages"""
         print(f"🔄 DFS Bot running at {datetime.now().strftime('%I:%M %p ET')}")
         
         try:
-            # Collect today's games
-            games = self.data_collector.get_today_games()
+            # Collect today's games, monitor live games and generate lineups concurrently
+            games, alerts, lineups = await asyncio.gather(
+                self.data_collector.aget_today_games(),
+                self.monitor.acheck_games(),
+                asyncio.to_thread(self.optimizer.generate_lineups, count=4)
+            )
             print(f"📊 Found {len(games)} games today")
-            
-            # Generate optimal lineups
-            lineups = self.optimizer.generate_lineups(count=4)
             print(f"🎯 Generated {len(lineups)} lineups")
             
-            # Monitor live games for alerts
-            alerts = self.monitor.check_games()
-            
             # Send notifications if alerts exist
             if alerts:
                 print(f"🚨 {len(alerts)} alerts found")
-                self.notifier.send_alerts(alerts)
+                await self.notifier.send_alerts_async(alerts)
             else:
                 print("✅ No alerts - lineup looking good")
             
+            # Deliver any queued swap/game updates in one Telegram message
+            await self.notifier.flush_async()
+            
             # Print lineup summary
             self.print_lineup_summary(lineups)
             
         except Exception as e:
             error_msg = f"❌ Bot error: {str(e)}"
             print(error_msg)
-            self.notifier.send_alerts([error_msg])
+            await self.notifier.send_alerts_async([error_msg])
+        
+        finally:
+            await self.notifier.aclose()
+            self.data_collector.close()
     
     def print_lineup_summary(self, lineups):
         """Print lineup summary to console"""